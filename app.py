@@ -1,39 +1,116 @@
+import os
+import gc
+import ctypes
+import threading
+import hmac
+import uuid
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
 from io import BytesIO
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter, monotonic
 from scipy.stats import linregress
 
 # Konfigurasi tampilan halaman Streamlit
 st.set_page_config(page_title="Analisis Pengangguran Jawa Barat", layout="wide")
 
+# Batas lunak memori per worker (MB), jeda minimal antar pengosongan (detik) dan jumlah entri cache
+# per-filter, bisa diatur lewat environment variable. Batas ini tidak dipaksakan: jika terlewati,
+# worker hanya berusaha mengembalikan memori ke OS (lihat bagian 13).
+MEMORI_MAKS_MB = int(os.environ.get("MEMORI_MAKS_MB", "1024"))
+MEMORI_JEDA_DETIK = int(os.environ.get("MEMORI_JEDA_DETIK", "300"))
+# Token tampilan admin (?admin=<token>); jika kosong, tampilan admin dimatikan
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN", "")
+# Sesi yang tidak rerun selama ini (detik) dianggap sudah selesai dan dihapus dari catatan alokasi
+SESI_KEDALUWARSA_DETIK = int(os.environ.get("SESI_KEDALUWARSA_DETIK", "1800"))
+CACHE_MAKS_ENTRI = int(os.environ.get("CACHE_MAKS_ENTRI", "64"))
+# Jumlah thread untuk menggambar grafik secara paralel
+RENDER_WORKERS = int(os.environ.get("RENDER_WORKERS", "4"))
+# Lokasi file data, bisa diganti (misalnya data sintetis untuk load test)
+DATA_PATH = os.environ.get("DATA_PATH", "cobadata.xlsx")
+
+# Titik waktu tiap bagian halaman, dipakai untuk pemantauan dan load test (loadtest.py)
+titik_waktu = [("mulai", perf_counter())]
+
+def catat_waktu(nama: str) -> None:
+    titik_waktu.append((nama, perf_counter()))
+
 # =========================
 # 1. LOAD & CLEANING DATA
 # =========================
 
-from typing import Any
+from typing import Any, Callable
+
+# Kolom wajib dan rentang tahun yang dianggap valid
+KOLOM_WAJIB = ['tahun', 'pendidikan', 'jumlah_pengangguran_terbuka']
+RENTANG_TAHUN_VALID = (1980, pd.Timestamp.now().year)
+
+# Versi dataset = waktu modifikasi file, supaya cache otomatis diperbarui jika file berubah
+def versi_data(path: str) -> float:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
 
-# Fungsi untuk load dan cleaning data, hasilnya di-cache supaya efisien
-@st.cache_data
-def load_data() -> pd.DataFrame:
+# Fungsi validasi skema dan kualitas data, dijalankan sekali per versi dataset (di dalam load_data)
+def validasi_data(df: pd.DataFrame, kategori_valid: set[str]) -> dict[str, Any]:
     """
-    Load and clean the unemployment data from CSV.
-    Returns a DataFrame with an additional 'pendidikan_bersih' column.
+    Run vectorized schema and quality checks on the raw data without modifying it.
+    Returns a quality report dict; counts of 0 and empty collections mean the check passed.
+    """
+    laporan: dict[str, Any] = {'baris': len(df)}
+
+    # Nilai hilang per kolom (sebelum kolom pendidikan diisi 'UNKNOWN')
+    hilang = df.isnull().sum()
+    laporan['nilai_hilang'] = {k: int(v) for k, v in hilang[hilang > 0].items()}
+
+    # Kolom numerik yang berisi nilai bukan angka; pemeriksaan berikutnya memakai salinan numeriknya
+    laporan['tipe_tidak_valid'] = {}
+    angka = {}
+    for kolom in ['tahun', 'jumlah_pengangguran_terbuka']:
+        angka[kolom] = pd.to_numeric(df[kolom], errors='coerce')
+        if not pd.api.types.is_numeric_dtype(df[kolom]):
+            laporan['tipe_tidak_valid'][kolom] = int((angka[kolom].isna() & df[kolom].notna()).sum())
+
+    tahun = angka['tahun']
+    laporan['tahun_di_luar_rentang'] = int((~tahun.between(*RENTANG_TAHUN_VALID) & tahun.notna()).sum())
+    laporan['duplikat_tahun_pendidikan'] = int(
+        pd.DataFrame({'tahun': tahun, 'pendidikan': df['pendidikan']}).duplicated(keep=False).sum()
+    )
+    laporan['jumlah_negatif'] = int((angka['jumlah_pengangguran_terbuka'] < 0).sum())
+    laporan['label_tidak_terpetakan'] = sorted(
+        df.loc[~df['pendidikan_bersih'].isin(kategori_valid), 'pendidikan'].fillna('UNKNOWN').astype(str).unique()
+    )
+    return laporan
+
+# Fungsi untuk load dan cleaning data, hasilnya di-cache supaya efisien.
+# Memakai cache_resource agar satu DataFrame dibagi ke semua sesi tanpa disalin;
+# karena itu df hanya boleh dibaca, jangan diubah di luar fungsi ini.
+# Hanya versi dataset terbaru yang disimpan (max_entries=1).
+@st.cache_resource(max_entries=1)
+def load_data(path: str, versi: float) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """
+    Load, clean and validate the unemployment data from the Excel file at `path`.
+    `versi` identifies the dataset version and is only used as part of the cache key.
+    Returns a shared, read-only DataFrame with an additional 'pendidikan_bersih' column,
+    together with its precomputed quality report.
     """
     try:
           # Membaca file Excel
-        df = pd.read_excel('cobadata.xlsx')
+        df = pd.read_excel(path)
     except Exception as e:
         # Jika gagal, tampilkan error dan return DataFrame kosong
         st.error(f"Error loading data: {e}")
-        return pd.DataFrame()  
+        return pd.DataFrame(), {}
 
-    # Cek apakah kolom 'pendidikan' ada
-    if 'pendidikan' not in df.columns:
-        st.error("Kolom 'pendidikan' tidak ditemukan dalam data.")
-        return pd.DataFrame()
+    # Cek apakah kolom wajib ada
+    kolom_hilang = [k for k in KOLOM_WAJIB if k not in df.columns]
+    if kolom_hilang:
+        st.error(f"Kolom {', '.join(kolom_hilang)} tidak ditemukan dalam data.")
+        return pd.DataFrame(), {}
 
     # Mapping kategori pendidikan ke standar
     education_map = {
@@ -58,16 +135,30 @@ def load_data() -> pd.DataFrame:
                 return val
         return x_upper
 
+    # Terapkan fungsi cleaning cukup sekali per label unik, lalu petakan ke seluruh kolom
+    label_bersih = {x: clean_education(x) for x in df['pendidikan'].dropna().unique()}
+    df['pendidikan_bersih'] = df['pendidikan'].map(label_bersih).fillna('UNKNOWN')
+
+    # Validasi dijalankan di sini supaya laporannya ikut tersimpan di cache bersama data
+    laporan = validasi_data(df, set(education_map.values()))
+
     # Isi nilai kosong di kolom pendidikan dengan 'UNKNOWN'
     df['pendidikan'] = df['pendidikan'].fillna('UNKNOWN')
 
-    # Terapkan fungsi cleaning ke kolom pendidika
-    df['pendidikan_bersih'] = df['pendidikan'].apply(clean_education)
+    # Pastikan kolom numerik benar-benar numerik; nilai bukan angka (sudah dilaporkan) jadi NaN
+    for kolom in ['tahun', 'jumlah_pengangguran_terbuka']:
+        if not pd.api.types.is_numeric_dtype(df[kolom]):
+            df[kolom] = pd.to_numeric(df[kolom], errors='coerce')
 
-    return df
+    return df, laporan
 
-# Load data ke dalam variabel df
-df = load_data()
+# Load data dan laporan kualitasnya ke dalam variabel df dan laporan_kualitas
+versi_dataset = versi_data(DATA_PATH)
+df, laporan_kualitas = load_data(DATA_PATH, versi_dataset)
+# Jika data gagal dimuat atau skemanya tidak valid, pesan error dari load_data jadi tampilan terakhir
+if df.empty:
+    st.stop()
+catat_waktu("load_data")
 
 # =========================
 # 2. DATA EXPLORATION
@@ -87,9 +178,9 @@ pendidikan_list = ['SD KE BAWAH', 'SD', 'SMP', 'SMA', 'DIPLOMA/UNIV']
 # Multiselect untuk memilih pendidikan
 pendidikan_pilih = st.sidebar.multiselect("Pilih pendidikan", pendidikan_list, pendidikan_list)
 
-# Filter data berdasarkan tahun dan pendidikan yang dipilih user
-df_filtered = df[(df['tahun'] >= tahun_range[0]) & (df['tahun'] <= tahun_range[1])]
-df_filtered = df_filtered[df_filtered['pendidikan_bersih'].isin(pendidikan_pilih)]
+# Filter data berdasarkan tahun dan pendidikan yang dipilih user (satu mask, satu salinan per sesi)
+mask = df['tahun'].between(tahun_range[0], tahun_range[1]) & df['pendidikan_bersih'].isin(pendidikan_pilih)
+df_filtered = df[mask]
 
 
 # =========================
@@ -103,6 +194,8 @@ with st.expander("Lihat Data Mentah"):
         """
     )
 
+catat_waktu("filter")
+
 # =========================
 # 4. STATISTIK DESKRIPTIF
 # =========================
@@ -111,20 +204,38 @@ st.subheader("Statistik Deskriptif")
 if df_filtered.empty:
     # Jika data kosong, tampilkan info
     st.info("Tidak ada data untuk ditampilkan pada statistik deskriptif.")
+    stats = pd.DataFrame()
 else:
-    # Tampilkan statistik deskriptif (mean, std, min, max) per pendidikan
-    st.dataframe(
+    # Hitung statistik deskriptif (mean, std, min, max) per pendidikan
+    stats = (
         df_filtered.groupby(['pendidikan_bersih'])['jumlah_pengangguran_terbuka']
-        .describe()[['mean', 'std', 'min', 'max']].round(0)
+        .describe()[['mean', 'std', 'min', 'max']]
     )
-
-# Cek data hilang di seluruh data
-missing = df.isnull().sum()
-if missing.any():
-    st.warning("Ada data hilang:\n" + str(missing[missing>0]))
+    st.dataframe(stats.round(0))
+
+# Tampilkan hasil validasi data (laporan sudah dihitung sekali saat load, tidak scan ulang)
+pesan_kualitas = []
+if laporan_kualitas.get('nilai_hilang'):
+    pesan_kualitas.append(f"Ada data hilang: {laporan_kualitas['nilai_hilang']}")
+if any(laporan_kualitas.get('tipe_tidak_valid', {}).values()):
+    pesan_kualitas.append(f"Nilai bukan angka pada kolom numerik: {laporan_kualitas['tipe_tidak_valid']}")
+if laporan_kualitas.get('tahun_di_luar_rentang'):
+    pesan_kualitas.append(
+        f"{laporan_kualitas['tahun_di_luar_rentang']} baris dengan tahun di luar rentang "
+        f"{RENTANG_TAHUN_VALID[0]}–{RENTANG_TAHUN_VALID[1]}"
+    )
+if laporan_kualitas.get('duplikat_tahun_pendidikan'):
+    pesan_kualitas.append(f"{laporan_kualitas['duplikat_tahun_pendidikan']} baris duplikat (tahun, pendidikan)")
+if laporan_kualitas.get('jumlah_negatif'):
+    pesan_kualitas.append(f"{laporan_kualitas['jumlah_negatif']} baris dengan jumlah pengangguran negatif")
+if laporan_kualitas.get('label_tidak_terpetakan'):
+    pesan_kualitas.append(f"Label pendidikan tidak terpetakan: {', '.join(laporan_kualitas['label_tidak_terpetakan'])}")
+if pesan_kualitas:
+    st.warning("Masalah kualitas data:\n\n" + "\n".join(f"- {p}" for p in pesan_kualitas))
 
 # Link ke interpretasi
 st.markdown("[Lanjut ke Interpretasi Hasil Visualisasi Statistik Deskriptif](#interpretasi-hasil-visualisasi-statistik-deskriptif)")
+catat_waktu("statistik")
 
 # =========================
 # 5. VISUALISASI TREN
@@ -144,33 +255,60 @@ pivot = df_filtered.pivot_table(
 available_cols = [col for col in pendidikan_list if col in pivot.columns]
 pivot = pivot[available_cols]
 
-# Jika data kosong, tampilkan info
-if pivot.empty or len(available_cols) == 0:
-    st.info("Silakan pilih minimal satu pendidikan dan tahun untuk menampilkan grafik tren pengangguran.")
-else:
+# Matriks korelasi untuk heatmap dan interpretasi otomatis
+corr = pivot.fillna(0).corr()
+
+# Grafik di bagian 5, 6, 7 dan 9 saling independen, jadi digambar bersamaan di thread pool.
+# Semua memakai API objek Figure (backend Agg) tanpa state global pyplot supaya aman antar thread,
+# dan langsung di-rasterisasi jadi PNG di thread tersebut.
+@st.cache_resource
+def pool_render() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=RENDER_WORKERS, thread_name_prefix="render")
+
+# Jumlah render yang belum selesai (mengantre atau berjalan) di worker ini, untuk tampilan admin
+@st.cache_resource
+def status_render() -> dict[str, Any]:
+    return {'lock': threading.Lock(), 'belum_selesai': 0}
+
+def kirim_render(fungsi: Callable[[pd.DataFrame], bytes], data: pd.DataFrame) -> Future:
+    status = status_render()
+
+    def ubah_antrean(selisih: int) -> None:
+        with status['lock']:
+            status['belum_selesai'] += selisih
+
+    ubah_antrean(1)
+    future = pool_render().submit(fungsi, data)
+    # Callback juga dipanggil jika future dibatalkan
+    future.add_done_callback(lambda _: ubah_antrean(-1))
+    return future
+
+def figure_ke_png(fig: Figure) -> bytes:
+    # Opsi sama dengan default st.pyplot (dpi 200, bbox tight).
+    # Setelah dirasterisasi, isi figure langsung dilepas (pengganti plt.close untuk Figure tanpa pyplot).
+    with BytesIO() as buf:
+        try:
+            fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+        finally:
+            fig.clear()
+        return buf.getvalue()
+
+def gambar_tren(pivot: pd.DataFrame) -> bytes:
     # Plot tren pengangguran per pendidikan
-    fig, ax = plt.subplots(figsize=(20,5))
+    fig = Figure(figsize=(20,5))
+    ax = fig.subplots()
     pivot.plot(ax=ax, marker='o')
     ax.set_ylabel("Jumlah Pengangguran")
     ax.set_xlabel("Tahun")
     ax.set_title("Tren Pengangguran Terbuka per Pendidikan")
     ax.legend(title="Pendidikan")
-    st.pyplot(fig)
-
-# Link ke interpretasi
-st.markdown("[Lanjut ke Interpretasi Hasil Visualisasi Tren](#interpretasi-hasil-visualisasi-tren)")
+    return figure_ke_png(fig)
 
-# =========================
-# 6. STACKED BAR CHART
-# =========================
-
-st.subheader("Proporsi Pengangguran per Pendidikan (Stacked Bar)")
-if pivot.empty or len(available_cols) == 0:
-    st.info("Silakan pilih minimal satu pendidikan dan tahun untuk menampilkan grafik proporsi pengangguran.")
-else:
-        # Hitung proporsi (%) pengangguran per pendidikan per tahun
+def gambar_stacked(pivot: pd.DataFrame) -> bytes:
+    # Hitung proporsi (%) pengangguran per pendidikan per tahun
     pivot_pct = pivot.div(pivot.sum(axis=1), axis=0) * 100
-    fig2, ax2 = plt.subplots(figsize=(20,5))
+    fig2 = Figure(figsize=(20,5))
+    ax2 = fig2.subplots()
     pivot_pct.plot(kind='bar', stacked=True, ax=ax2, colormap='tab20')
 
     ax2.set_ylabel("Persentase (%)")
@@ -193,59 +331,19 @@ else:
                     color='white' if height > 5 else 'black'  # warna teks agar kontras
                 )
             cum_height += height
+    return figure_ke_png(fig2)
 
-    st.pyplot(fig2)
-
-# Link ke interpretasi
-st.markdown("[Lanjut ke Interpretasi Hasil Visualisasi Stacked Bar](#interpretasi-hasil-visualisasi-stacked-bar)")
-
-# =========================
-# 7. HEATMAP KORELASI
-# =========================
-
-st.subheader("Heatmap Korelasi Tahun vs Pengangguran per Pendidikan")
-if pivot.empty or len(available_cols) == 0:
-    st.info("Tidak ada data untuk membuat heatmap korelasi.")
-else:
-    corr_df = pivot.fillna(0)
-    corr = corr_df.corr()
-    fig4, ax4 = plt.subplots(figsize=(20,5))
+def gambar_heatmap(corr: pd.DataFrame) -> bytes:
+    fig4 = Figure(figsize=(20,5))
+    ax4 = fig4.subplots()
     sns.heatmap(corr, annot=True, cmap='coolwarm', ax=ax4)
     ax4.set_title("Korelasi Jumlah Pengangguran antar Pendidikan")
-    st.pyplot(fig4)
-
-# Link ke interpretasi
-st.markdown("[Lanjut ke Interpretasi Hasil Visualisasi HeatMap Korelasi](#interpretasi-hasil-visualisasi-heatmap-korelasi)")
-
-# =========================
-# 8. REGRESI LINEAR SEDERHANA
-# =========================
-
-st.subheader("Regresi Linear Sederhana (Tren Pengangguran per Pendidikan)")
-from scipy.stats import linregress
-
-if pivot.empty or len(available_cols) == 0:
-    st.info("Tidak ada data untuk regresi linear.")
-else:
-    # Lakukan regresi linear untuk setiap pendidikan
-    for p in available_cols:
-        y = pivot[p].dropna()
-        x = y.index.values     
-        if len(y) > 1:
-            slope, intercept, r_value, p_value, std_err = linregress(x, y)
-            st.info(f"{p}: y = {slope:.0f}x + {intercept:.0f} | R²={r_value**2:.2f} | {'Naik' if slope>0 else 'Turun'}")
-# Link ke interpretasi 
-st.markdown("[Lanjut ke Interpretasi Hasil Visualisasi Regresi Linear Sederhana](#interpretasi-hasil-visualisasi-regresi-linear-sederhana)")
-# =========================
-# 9. GROUPED BAR CHART (BAR SAMPINGAN)
-# =========================
+    return figure_ke_png(fig4)
 
-st.subheader("Jumlah Pengangguran Terbuka per Pendidikan per Tahun (Grouped Bar Chart)")
-if pivot.empty or len(available_cols) == 0:
-    st.info("Silakan pilih minimal satu pendidikan dan tahun untuk menampilkan grouped bar chart.")
-else:
+def gambar_grouped(pivot: pd.DataFrame) -> bytes:
     # Plot grouped bar chart
-    fig5, ax5 = plt.subplots(figsize=(18,6))
+    fig5 = Figure(figsize=(18,6))
+    ax5 = fig5.subplots()
     bar_width = 0.15
     index = np.arange(len(pivot.index))
     for i, col in enumerate(pivot.columns):
@@ -254,13 +352,126 @@ else:
     ax5.set_ylabel('Jumlah Pengangguran')
     ax5.set_title('Jumlah Pengangguran Terbuka per Pendidikan per Tahun (Grouped Bar Chart)')
     ax5.set_xticks(index + bar_width * (len(pivot.columns)-1) / 2)
-    ax5.set_xticklabels(pivot.index)
+    ax5.set_xticklabels(pivot.index, rotation=0)
     ax5.legend()
-    plt.xticks(rotation=0)
-    plt.tight_layout()
-    st.pyplot(fig5)
-# Link ke interpretasi 
-st.markdown("[Lanjut ke Interpretasi Hasil Visualisasi Grouped Bar Chart](#interpretasi-hasil-visualisasi-grouped-bar-chart)")
+    fig5.tight_layout()
+    return figure_ke_png(fig5)
+
+# Fungsi bantu format angka gaya Indonesia (1.234.567 dan 0,94)
+def format_angka(x: float) -> str:
+    return f"{x:,.0f}".replace(",", ".")
+
+def format_desimal(x: float, digit: int = 2) -> str:
+    return f"{x:.{digit}f}".replace(".", ",")
+
+# Persamaan regresi dengan tanda intercept eksplisit, dipakai di bagian 8 dan interpretasi
+def format_persamaan(slope: float, intercept: float) -> str:
+    return f"y = {slope:.0f}x {'-' if intercept < 0 else '+'} {abs(intercept):.0f}"
+
+# Fungsi regresi linear per pendidikan (bagian 8), hasilnya dipakai ulang untuk interpretasi
+def hitung_regresi(pivot: pd.DataFrame) -> pd.DataFrame:
+    """
+    Fit a simple linear regression (jumlah vs tahun) for every education column.
+    Returns a DataFrame indexed by pendidikan with 'slope', 'intercept' and 'r2' columns.
+    """
+    hasil = {}
+    for p in pivot.columns:
+        y = pivot[p].dropna()
+        x = y.index.values
+        if len(y) > 1:
+            slope, intercept, r_value, p_value, std_err = linregress(x, y)
+            hasil[p] = {'slope': slope, 'intercept': intercept, 'r2': r_value**2}
+    return pd.DataFrame.from_dict(hasil, orient='index', columns=['slope', 'intercept', 'r2'])
+
+regresi = hitung_regresi(pivot)
+
+# PNG chart tren untuk tombol download (diisi saat chart ditampilkan)
+png_tren = None
+
+# Kirim semua grafik ke pool sekarang; hasilnya diambil berurutan sesuai urutan halaman.
+# Pool dipakai bersama semua sesi, jadi jika rerun ini diinterupsi (misalnya user menggeser slider),
+# grafik yang belum selesai dibatalkan di blok finally supaya tidak mengantre di depan sesi lain.
+grafik = {}
+try:
+    if not pivot.empty and len(available_cols) > 0:
+        grafik = {
+            'tren': kirim_render(gambar_tren, pivot),
+            'stacked': kirim_render(gambar_stacked, pivot),
+            'korelasi': kirim_render(gambar_heatmap, corr),
+            'grouped': kirim_render(gambar_grouped, pivot),
+        }
+
+    # Jika data kosong, tampilkan info
+    if pivot.empty or len(available_cols) == 0:
+        st.info("Silakan pilih minimal satu pendidikan dan tahun untuk menampilkan grafik tren pengangguran.")
+    else:
+        # PNG yang sama dipakai untuk tampilan dan tombol download
+        png_tren = grafik['tren'].result()
+        st.image(png_tren, width="stretch")
+
+    # Link ke interpretasi
+    st.markdown("[Lanjut ke Interpretasi Hasil Visualisasi Tren](#interpretasi-hasil-visualisasi-tren)")
+    catat_waktu("tren")
+
+    # =========================
+    # 6. STACKED BAR CHART
+    # =========================
+
+    st.subheader("Proporsi Pengangguran per Pendidikan (Stacked Bar)")
+    if pivot.empty or len(available_cols) == 0:
+        st.info("Silakan pilih minimal satu pendidikan dan tahun untuk menampilkan grafik proporsi pengangguran.")
+    else:
+        st.image(grafik['stacked'].result(), width="stretch")
+
+    # Link ke interpretasi
+    st.markdown("[Lanjut ke Interpretasi Hasil Visualisasi Stacked Bar](#interpretasi-hasil-visualisasi-stacked-bar)")
+    catat_waktu("stacked")
+
+    # =========================
+    # 7. HEATMAP KORELASI
+    # =========================
+
+    st.subheader("Heatmap Korelasi Tahun vs Pengangguran per Pendidikan")
+    if pivot.empty or len(available_cols) == 0:
+        st.info("Tidak ada data untuk membuat heatmap korelasi.")
+    else:
+        st.image(grafik['korelasi'].result(), width="stretch")
+
+    # Link ke interpretasi
+    st.markdown("[Lanjut ke Interpretasi Hasil Visualisasi HeatMap Korelasi](#interpretasi-hasil-visualisasi-heatmap-korelasi)")
+    catat_waktu("korelasi")
+
+    # =========================
+    # 8. REGRESI LINEAR SEDERHANA
+    # =========================
+
+    st.subheader("Regresi Linear Sederhana (Tren Pengangguran per Pendidikan)")
+
+
+    if pivot.empty or len(available_cols) == 0:
+        st.info("Tidak ada data untuk regresi linear.")
+    else:
+        # Tampilkan persamaan regresi untuk setiap pendidikan
+        for p, row in regresi.iterrows():
+            st.info(f"{p}: {format_persamaan(row['slope'], row['intercept'])} | R²={format_desimal(row['r2'])} | {'Naik' if row['slope']>0 else 'Turun'}")
+    # Link ke interpretasi 
+    st.markdown("[Lanjut ke Interpretasi Hasil Visualisasi Regresi Linear Sederhana](#interpretasi-hasil-visualisasi-regresi-linear-sederhana)")
+    catat_waktu("regresi")
+    # =========================
+    # 9. GROUPED BAR CHART (BAR SAMPINGAN)
+    # =========================
+
+    st.subheader("Jumlah Pengangguran Terbuka per Pendidikan per Tahun (Grouped Bar Chart)")
+    if pivot.empty or len(available_cols) == 0:
+        st.info("Silakan pilih minimal satu pendidikan dan tahun untuk menampilkan grouped bar chart.")
+    else:
+        st.image(grafik['grouped'].result(), width="stretch")
+    # Link ke interpretasi 
+    st.markdown("[Lanjut ke Interpretasi Hasil Visualisasi Grouped Bar Chart](#interpretasi-hasil-visualisasi-grouped-bar-chart)")
+    catat_waktu("grouped")
+finally:
+    for future in grafik.values():
+        future.cancel()
 
 # =========================
 # 10. DOWNLOAD DATA & CHART
@@ -272,489 +483,423 @@ csv = df_filtered.to_csv(index=False).encode()
 st.sidebar.download_button("Download Data Filtered (CSV)", csv, "data_filtered.csv", "text/csv")
 
 # Download chart tren sebagai PNG
-if not pivot.empty and len(available_cols) > 0:
-    buf = BytesIO()
-    fig.savefig(buf, format="png")
-    st.sidebar.download_button("Download Chart Tren (PNG)", buf.getvalue(), "chart_tren.png", "image/png")
+if png_tren is not None:
+    st.sidebar.download_button("Download Chart Tren (PNG)", png_tren, "chart_tren.png", "image/png")
 
 # link github
 st.sidebar.markdown("---") # Garis pemisah untuk keterbacaan
 st.sidebar.subheader("Kode Sumber Proyek")
 st.sidebar.info("[Lihat di GitHub](https://github.com/Firnianoor/uasalgoritma)")
+catat_waktu("download")
 
 
-# =========================
-# 11. README SINGKAT
-# =========================
-
-
-st.markdown("""
----
-## ✍ Interpretasi Hasil Visualisasi Statistik Deskriptif
-
- Interpretasi dari tabel Statistik Deskriptif Pengangguran Terbuka per Pendidikan
-            
-**1. Rata-rata Jumlah Pengangguran (mean)**
-             
-
-        SMA memiliki rata-rata pengangguran tertinggi: 742.797 orang.
-
-Disusul oleh:
-                   
-    - SD                     : 454.061        
-    - SMP                    : 451.671
-    - SD ke Bawah            : 188.510
-    - Diploma/Universitas    : 171.853
-            
-Artinya: 
-            
-            Lulusan SMA paling rentan mengalami pengangguran terbuka, 
-            
-Kemungkinan karena terjebak di tengah: 
-
-            Tidak cukup kualifikasi untuk pekerjaan profesional, tetapi terlalu tinggi untuk pekerjaan kasar.
-
----          
-
-**2. Standar Deviasi (std)**
-            
-            Nilai std menunjukkan seberapa besar variasi data dari rata-rata.
-
-    - SD (295.966) dan SMA (176.187), 
-            menunjukkan fluktuasi besar dalam jumlah pengangguran dari tahun ke tahun.
-            -------------------------------------------------------------------------
-    - Diploma/Universitas punya fluktuasi paling kecil (103.322), 
-            menunjukkan tren yang lebih stabil.
----
-            
-**3. Nilai Minimum dan Maksimum**
-            
-    Datanya:
-        - SD: Maksimum sangat tinggi (1.272.366), 
-            menunjukkan kemungkinan lonjakan ekstrem di tahun tertentu (kemungkinan besar 2020).
-            ---------------------------------------------------------------------------------
-        - SMA juga tinggi (1.014.084), 
-            konsisten dengan grafik tren sebelumnya.
-            ---------------------------------------------------------------------------------
-        - Diploma/Univ dan SD ke Bawah memiliki nilai maksimum lebih rendah.
----
-            
-**4. Perbandingan Extremes**
-            
-    Perbandingannya:
-       - Lulusan SD dan SMA 
-            menunjukkan potensi risiko pengangguran dalam jumlah besar, apalagi saat terjadi krisis (misalnya pandemi).
-            ----------------------------------------------------------------------------------
-       - Lulusan Diploma/Universitas 
-            lebih stabil dan rendah, menandakan pendidikan tinggi masih menawarkan perlindungan terhadap pengangguran terbuka, meskipun tidak sepenuhnya aman.
----
-""")
-
-st.markdown("""
----
-## ✍ Interpretasi Hasil Visualisasi Tren 
-            
-    Interpretasi dari grafik “Tren Pengangguran Terbuka per Pendidikan”
-
-**1. Lulusan SMA Paling Rentan Pengangguran**
-
-    Maksudnya:          
-        - Garis merah (SMA) konsisten paling tinggi dibanding jenjang lain dari 2011 hingga 2023.
-        - Ini menunjukkan bahwa lulusan SMA paling banyak menganggur.
-        - Kemungkinan besar mereka belum melanjutkan ke perguruan tinggi tapi juga tidak langsung terserap ke pasar kerja.
-
-**2. Puncak Pengangguran Tahun 2020**
-    
-    Maksudnya:
-        - Terjadi lonjakan ekstrem pada semua jenjang pendidikan, terutama SMA dan SD.
-        - Ini sejalan dengan dampak ekonomi pandemi COVID-19 yang menyebabkan banyaknya PHK dan pembatasan kerja.
-
-**3. Penurunan Setelah 2020**
-            
-    Maksudnya:
-        - Setelah puncak 2020, jumlah pengangguran menurun pada semua tingkat pendidikan.
-        - Namun, SMA masih mendominasi angka pengangguran, meskipun trennya menurun perlahan.
-
-**4. Pengangguran Lulusan Diploma/Universitas Tetap Stabil**
-            
-    Maksudnya:
-        - Garis ungu (DIPLOMA/UNIV) berada di bawah SMA, SMP, dan SD.
-        - Ini mengindikasikan bahwa lulusan perguruan tinggi memiliki kemampuan kerja lebih tinggi dan lebih terlindungi dari pengangguran terbuka.
-
-5. SD ke Bawah dan SD Relatif Lebih Rendah
-            
-    Maksudnya:
-        - Lulusan SD ke bawah dan SD punya angka pengangguran lebih rendah.
-        - Mungkin karena mereka banyak bekerja di sektor informal yang tidak tercatat sebagai pengangguran resmi.
----
-""")
-
-st.markdown("""
----
-## ✍ Interpretasi Hasil Visualisasi Stacked Bar
-
-Interpretasi Grafik Proporsi Pengangguran Terbuka Berdasarkan Tingkat Pendidikan (2011–2023)
-Grafik di atas menampilkan komposisi pengangguran terbuka di jawa barat berdasarkan jenjang pendidikan dari tahun 2011 hingga 2023. Data divisualisasikan dalam bentuk stacked bar (batang bertumpuk), yang menunjukkan proporsi relatif tiap jenjang pendidikan terhadap total pengangguran pada setiap tahunnya.
-
-Jenjang pendidikan dikelompokkan ke dalam lima kategori:
-         
-    - SD ke bawah
-         
-    - SD
-        
-    - SMP
-         
-    - SMA
-         
-    - Diploma/Universitas
-
-
-Temuan Utama:
-
-**Dominasi Pengangguran Lulusan SMA/Sederajat:**
-            
-     Sepanjang periode 2011–2023, proporsi terbesar pengangguran berasal dari lulusan **SMA/Sederajat**. Misalnya, pada tahun 2023,
-    lulusan SMA/Sederajat menyumbang sekitar 56,4% dari total pengangguran terbuka.menunjukkan dominasi yang signifikan. Proporsi ini
-     secara konsisten menjadi yang terbesar setiap tahunnya.
-
-
-**Penurunan Proporsi Pengangguran dari Lulusan Diploma/Universitas**
-
-            
-     - Proporsi pengangguran dari lulusan pendidikan tinggi cenderung menurun, dari 7,4% di tahun 2011 menjadi 7,7% di tahun 2023,
-     meskipun sempat naik-turun di tengah periode.
-    - Ini dapat mencerminkan peningkatan penyerapan lulusan perguruan tinggi oleh pasar kerja, atau pergeseran dalam strategi pencarian kerja oleh lulusan tinggi.
-
-**Kecenderungan Turunnya Proporsi dari SD ke Bawah**
-
-            
-     Terlihat adanya penurunan signifikan dalam proporsi pengangguran dari kelompok pendidikan rendah (SD ke bawah), dari 12,4% pada
-    2011 menjadi hanya 3,7% di 2018, meski kemudian meningkat menjadi 6,4% di 2020 dan kembali di kisaran 19,3% pada tahun 2023.
-
-**Stabilitas Proporsi SMP**
-
-            
-     Proporsi pengangguran dari lulusan SMP relatif stabil, berada di kisaran 15%–28% selama periode yang diamati. Puncaknya terlihat
-    pada tahun 2012 dengan 27,9% dan 2013 dengan 27,6%.
-
-
-**Proporsi Lulusan SD**
-            
-     Proporsi pengangguran dari lulusan SD juga cukup signifikan, meskipun tidak setinggi SMA. Angka ini berkisar antara 15% hingga
-    33% dari total pengangguran. Proporsi tertinggi terlihat pada tahun 2012 (26.3%) dan 2020 (25.4%), menunjukkan bahwa lulusan SD
-    masih menghadapi tantangan serius di pasar kerja, terutama di masa krisis.
-
----
-""")
-
-st.markdown("""
----
-## ✍ Interpretasi Hasil Visualisasi Heatmap Korelasi
-
-
-Interpretasi Korelasi antar Jenjang Pendidikan :
-            
-**1. SD ke Bawah**
-            
-       Dengan SD → -0.24
-            
-Artinya, saat pengangguran lulusan SD naik, pengangguran SD ke bawah cenderung turun (hubungan berlawanan).
-
-         Dengan SMP → 0.13
-            
-Hubungannya sangat lemah (hampir tidak berkaitan).
-
-         Dengan SMA → 0.52
-
-Ada hubungan sedang. Kalau pengangguran SMA naik, SD ke bawah juga bisa naik, tapi tidak terlalu kuat.
-
-          
-         Dengan Diploma/Univ → 0.32
-
-Hubungan lemah ke sedang.
-            
----
-
-**2. SD**
-            
-         Dengan SMP → 0.91
-
-Hubungan sangat kuat. Jika pengangguran SMP naik, SD juga hampir pasti naik.
-
-         Dengan SMA → 0.47
-            
-Hubungan cukup kuat, tapi tidak sekuat dengan SMP.
-
-         Dengan Diploma/Univ → 0.67
-
-Hubungan kuat.
-            
----
-
-**3. SMP**
-            
-         Dengan SMA → 0.60
-            
-Korelasi kuat.
-
-         Dengan Diploma/Univ → 0.73
-            
-Korelasi sangat kuat. Artinya tren pengangguran mereka sangat mirip.
-            
----
-
-**4. SMA**
-            
-         Dengan Diploma/Univ → 0.94
-
-Inilah korelasi tertinggi antar jenjang berbeda di heatmap ini. Artinya, pengangguran SMA dan Diploma/Univ cenderung selalu naik/turun bersamaan.
-
----
-            
-**5. Diploma/Univ**
-
-         Korelasi tertinggi dengan SMA (0.94), lalu SMP (0.73), dan SD (0.67).
-
-Korelasi terendah dengan SD ke bawah (0.32).
-
-            
----
-""")
 
-st.markdown("""
----
-## ✍ Interpretasi Hasil Visualisasi Regresi Linear Sederhana
-Interpretasi berikut merangkum hasil analisis regresi linear sederhana untuk masing-masing jenjang pendidikan. Setiap bagian menampilkan persamaan regresi, nilai R-squared, dan tren yang dihasilkan.
 
----
-
-**1. SD ke bawah**
-    
-     SD KE BAWAH : y = 24434x + -49066609 | R²=0,37 | Naik
-
-Regresi persamaan: y = 24434x - 49066609.
-Hal ini menunjukkan bahwa untuk setiap peningkatan satu tahun (variabel independen 'x' adalah tahun), **jumlah pengangguran terbuka** untuk kelompok SD ke bawah cenderung meningkat sebesar 24.434 orang.
-Intersep -49.066.609 adalah nilai prediksi jumlah pengangguran ketika tahun bernilai nol (ini adalah proyeksi matematis dan mungkin tidak memiliki makna praktis langsung, karena tahun 0 jauh dari data kita).
-
-
-     R-kuadrat (R²): 0,37.
-Sekitar 37% variasi **jumlah pengangguran terbuka** SD ke bawah dapat dijelaskan oleh model regresi ini. Sisanya dipengaruhi faktor lain.
-
-     Tren: Naik.
-            
-Artinya, tren **jumlah pengangguran terbuka** SD ke bawah cenderung meningkat seiring waktu.
-
----
-            
-**2. SD**
-            
-     SD : y = -21897x + 44515094 | R²=0,07 | Turun
-
-Persamaan Regresi: y = -21897x + 44515094.
-Setiap kenaikan satu tahun pada variabel independen cenderung menurunkan **jumlah pengangguran terbuka** lulusan SD sebesar 21.897 orang.
-
-     R-kuadrat (R²): 0,07.
-Sekitar 7% variasi **jumlah pengangguran terbuka** SD dapat dijelaskan oleh model ini; hubungan sangat lemah.
-
-     Tren: Turun.
-            
-**Jumlah pengangguran terbuka** lulusan SD cenderung menurun seiring berjalannya waktu.
-
-
-**3. SMP/Sederajat**
-            
-     SMP : y = -5442x + 11428684 | R²=0,02 | Turun
-
-Persamaan Regresi: y = -5442x + 11428684.
-Setiap kenaikan satu tahun pada variabel independen cenderung menurunkan **jumlah pengangguran terbuka** lulusan SMP sebesar 5.442 orang.
-
-     R-kuadrat (R²): 0,02.
-Hanya 2% variasi **jumlah pengangguran terbuka** SMP yang dijelaskan model ini; hubungan sangat lemah.
-
-     Tren: Turun.
-            
-**Jumlah pengangguran terbuka** lulusan SMP cenderung menurun seiring berjalannya waktu.
-
----
-
-**4. SMA/Sederajat**
-            
-     SMA: y = 64566x - 129258105 | R² = 0,46 | Naik
-
-Regresi Persamaan: y = 64566x - 129258105.
-Setiap kenaikan satu tahun pada variabel independen meningkatkan **jumlah pengangguran terbuka** lulusan SMA sebesar 64.566 orang.
-
-     R-kuadrat (R²): 0,46.
-Sekitar 46% variasi **jumlah pengangguran terbuka** SMA dapat dijelaskan model ini; hubungan moderat-kuat.
-            
-     Tren: Naik.
-
-**Jumlah pengangguran terbuka** lulusan SMA cenderung meningkat seiring waktu.
-
----
-
-**5. D3/S1/Sederajat**
-     DIPLOMA/UNIV: y = 12211x + -24457368 | R²=0,21 | Naik
-
-Regresi Persamaan: y = 12211x - 24457368.
-Setiap kenaikan satu tahun pada variabel independen meningkatkan **jumlah pengangguran terbuka** diploma/Universitas sebesar 12.211 orang.
-
-     R-kuadrat (R²): 0,21.
-Sekitar 21% variasi **jumlah pengangguran terbuka** pendidikan Diploma/Universitas dijelaskan model ini; hubungan lemah-moderat.
-
-     Tren: Naik.
-            
-**Jumlah pengangguran terbuka** lulusan Diploma/Universitas cenderung meningkat seiring waktu.
-                           
----
-""")
-
-st.markdown("""
----
-## ✍ Interpretasi Hasil Visualisasi Grouped Bar Chart
-
-**1. Deskripsi Umum Grafik**
-
-Grafik ini menyajikan data jumlah pengangguran terbuka berdasarkan tingkat pendidikan dari tahun 2011 hingga 2023. Setiap tahun ditampilkan dalam bentuk kelompok batang (*grouped bar*), masing-masing mewakili jenjang pendidikan berikut:
-
-            
-
-        Biru   : SD ke bawah
-            
-    Oranye : SD
-
-    Hijau  : SMP
-
-    Merah  : SMA
-            
-    Ungu   : Diploma/Universitas
-
-
-Sumbu vertikal menunjukkan jumlah pengangguran (dalam jutaan orang), dan sumbu horizontal menunjukkan tahun (2011–2023).
-
----
-
-**2. Pola dan Tren Tiap Jenjang Pendidikan**
-
-A. Lulusan SMA (Merah)
-
-     Selalu menjadi kelompok dengan tingkat penurunan tertinggi setiap tahun.
-
-    Puncaknya pada tahun 2020: lebih dari 2 juta kemiskinan.
-
-
-Setelah tahun 2020, jumlahnya turun tetapi masih paling tinggi dibandingkan jenjang lain:
-     
-     2021: sekitar 1,5 juta
-            
-    2022: sekitar 1,45 juta
-            
-    2023: sekitar 1,4 juta
-
-B. Lulusan SMP (Hijau)
-
-     Umumnya berada di posisi kedua atau ketiga tertinggi.
-
-    Terakhir mengalami peningkatan cukup tajam pada tahun 2020: sekitar 1 juta penurunan.
-
-Setelah tahun 2020, terjadi penurunan:
-            
-     2021: ±800 ribu
-            
-    2023: ±750 ribu
-
-C. Lulusan SD (Orange)
-
-     Cenderung stabil sebelum tahun 2020 (sekitar 300–450 ribu).
-
-    Lonjakan besar pada tahun 2020: sekitar 1,2 juta penurunan.
-
-Setelah itu menurun:
-            
-     2021: ±600 ribu
-            
-    2023: ±550 ribu
-
-D. SD ke Bawah (Biru)
-
-     Jumlah kemiskinan paling rendah selama 2011–2019.
-
-Namun meningkat signifikan setelah pandemi:
-            
-     2020: ±400 ribu
-            
-    2021: ±650 ribu (tertinggi sepanjang periode untuk peningkatan ini)
-            
-    2023: ±600 ribu
-
-E. Diploma/Universitas (Ungu)
-
-     Konsisten sebagai peningkatan dengan kemiskinan menengah.
-
-Tidak terlalu fluktuatif kecuali di 2020:
-
-     2020: ±650 ribu
-
-    2023: turun ke ±300 ribu
-
-
----
-
-**3. Tahun Spesial: 2020**
-
-Semua peningkatan mengalami penurunan tingkat kemiskinan yang signifikan, terutama:
-
-     SMA: naik drastis ke ±2,1 juta
+# =========================
+# 11. INTERPRETASI OTOMATIS
+# =========================
 
-    SD: naik menjadi ±1,2 juta
+# Kategori kekuatan korelasi berdasarkan nilai absolut r
+def kekuatan_korelasi(r: float) -> str:
+    r_abs = abs(r)
+    if r_abs >= 0.8:
+        return "sangat kuat"
+    if r_abs >= 0.6:
+        return "kuat"
+    if r_abs >= 0.4:
+        return "sedang"
+    if r_abs >= 0.2:
+        return "lemah"
+    return "sangat lemah"
+
+# Semua pasangan pendidikan berbeda beserta nilai korelasinya, urut dari tertinggi
+def pasangan_korelasi(corr: pd.DataFrame) -> pd.Series:
+    kolom = list(corr.columns)
+    nilai = {(a, b): corr.loc[a, b] for i, a in enumerate(kolom) for b in kolom[i + 1:]}
+    return pd.Series(nilai, dtype=float).dropna().sort_values(ascending=False)
+
+def interpretasi_statistik(stats: pd.DataFrame) -> str:
+    rata = stats['mean'].sort_values(ascending=False)
+    teratas, terbawah = rata.index[0], rata.index[-1]
+    baris = [
+        "**1. Rata-rata Jumlah Pengangguran (mean)**",
+        "",
+        f"{teratas} memiliki rata-rata pengangguran tertinggi: **{format_angka(rata.iloc[0])}** orang.",
+    ]
+    if len(rata) > 1:
+        baris += ["", "Disusul oleh:", ""]
+        baris += [f"- {p}: {format_angka(m)}" for p, m in rata.iloc[1:].items()]
+
+    std = stats['std'].dropna().sort_values(ascending=False)
+    if len(std) > 1:
+        baris += [
+            "",
+            "**2. Standar Deviasi (std)**",
+            "",
+            f"Fluktuasi terbesar dari tahun ke tahun terjadi pada {std.index[0]} (std {format_angka(std.iloc[0])}), "
+            f"sedangkan {std.index[-1]} paling stabil (std {format_angka(std.iloc[-1])}).",
+        ]
+
+    maks = stats['max'].sort_values(ascending=False)
+    baris += ["", "**3. Nilai Minimum dan Maksimum**", ""]
+    baris += [
+        f"- {p}: minimum {format_angka(stats.loc[p, 'min'])}, maksimum {format_angka(stats.loc[p, 'max'])}"
+        for p in maks.index
+    ]
+
+    if len(rata) > 1 and rata.iloc[-1] > 0:
+        baris += [
+            "",
+            "**4. Perbandingan Extremes**",
+            "",
+            f"Rata-rata pengangguran {teratas} sekitar {format_desimal(rata.iloc[0] / rata.iloc[-1], 1)} kali "
+            f"rata-rata {terbawah}, kelompok dengan rata-rata terendah.",
+        ]
+    return "\n".join(baris)
+
+def interpretasi_tren(pivot: pd.DataFrame) -> str:
+    rata = pivot.mean().sort_values(ascending=False)
+    teratas = rata.index[0]
+    dominan = pivot.idxmax(axis=1)  # Pendidikan tertinggi di tiap tahun
+    total = pivot.sum(axis=1)
+    tahun_puncak = total.idxmax()
+    tahun_awal, tahun_akhir = pivot.index.min(), pivot.index.max()
+
+    baris = [
+        f"**1. Lulusan {teratas} Paling Rentan Pengangguran**",
+        "",
+        f"- Garis {teratas} menjadi yang tertinggi pada {int((dominan == teratas).sum())} dari {len(pivot)} tahun "
+        f"({tahun_awal}–{tahun_akhir}).",
+        "",
+        f"**2. Puncak Pengangguran Tahun {tahun_puncak}**",
+        "",
+        f"- Total pengangguran pada pendidikan terpilih mencapai {format_angka(total.max())} orang.",
+    ]
+    puncak_bersama = [p for p in pivot.columns if pivot[p].idxmax() == tahun_puncak]
+    if puncak_bersama:
+        baris.append(f"- Jenjang yang juga mencapai puncaknya di tahun ini: {', '.join(puncak_bersama)}.")
+
+    if tahun_puncak < tahun_akhir:
+        perubahan = (total.loc[tahun_akhir] - total.max()) / total.max() * 100
+        baris += [
+            "",
+            f"**3. Setelah {tahun_puncak}**",
+            "",
+            f"- Total pengangguran berubah {format_desimal(perubahan, 1)}% hingga {tahun_akhir}.",
+            f"- Pada {tahun_akhir}, angka tertinggi berasal dari {dominan.loc[tahun_akhir]}.",
+        ]
+
+    variasi = (pivot.std() / pivot.mean()).dropna()
+    if len(variasi) > 1:
+        baris += [
+            "",
+            f"**4. Pengangguran {variasi.idxmin()} Paling Stabil**",
+            "",
+            f"- Koefisien variasi terkecil ({format_desimal(variasi.min())}), sedangkan {variasi.idxmax()} "
+            f"paling fluktuatif ({format_desimal(variasi.max())}).",
+        ]
+    if len(rata) > 1:
+        baris += [
+            "",
+            f"**5. {rata.index[-1]} Relatif Paling Rendah**",
+            "",
+            f"- Rata-rata {format_angka(rata.iloc[-1])} orang per tahun.",
+        ]
+    return "\n".join(baris)
+
+def interpretasi_stacked(pivot: pd.DataFrame) -> str:
+    pivot_pct = pivot.div(pivot.sum(axis=1), axis=0) * 100
+    rata_pct = pivot_pct.mean().sort_values(ascending=False)
+    teratas = rata_pct.index[0]
+    tahun_awal, tahun_akhir = pivot_pct.index.min(), pivot_pct.index.max()
+
+    baris = [
+        f"Grafik menampilkan komposisi pengangguran terbuka per jenjang pendidikan dari {tahun_awal} hingga {tahun_akhir}.",
+        "",
+        f"**Dominasi Pengangguran Lulusan {teratas}:**",
+        "",
+        f"Rata-rata proporsi {teratas} adalah {format_desimal(rata_pct.iloc[0], 1)}% dari total pengangguran; "
+        f"pada {tahun_akhir} proporsinya {format_desimal(pivot_pct.loc[tahun_akhir, teratas], 1)}%.",
+        "",
+        "**Perubahan Proporsi per Pendidikan:**",
+        "",
+    ]
+    for p in rata_pct.index:
+        kolom = pivot_pct[p].dropna()
+        if kolom.empty:
+            continue
+        baris.append(
+            f"- {p}: {format_desimal(kolom.iloc[0], 1)}% ({kolom.index[0]}) → {format_desimal(kolom.iloc[-1], 1)}% "
+            f"({kolom.index[-1]}), berkisar {format_desimal(kolom.min(), 1)}%–{format_desimal(kolom.max(), 1)}% "
+            f"dengan puncak di {kolom.idxmax()}."
+        )
+    return "\n".join(baris)
+
+def interpretasi_korelasi(corr: pd.DataFrame) -> str:
+    pasangan = pasangan_korelasi(corr)
+    if pasangan.empty:
+        return "Korelasi membutuhkan minimal dua pendidikan dengan data yang bervariasi."
+
+    baris = ["Interpretasi Korelasi antar Jenjang Pendidikan :", ""]
+    for (a, b), r in pasangan.items():
+        arah = "searah" if r >= 0 else "berlawanan"
+        baris.append(f"- {a} dengan {b} → {format_desimal(r)} (hubungan {kekuatan_korelasi(r)}, {arah})")
+    (a, b), r = next(iter(pasangan.items()))
+    baris += [
+        "",
+        f"Korelasi tertinggi antar jenjang berbeda adalah {a} dan {b} ({format_desimal(r)}). "
+        "Artinya, pengangguran kedua kelompok ini cenderung naik/turun bersamaan.",
+    ]
+    if len(pasangan) > 1:
+        (a, b), r = list(pasangan.items())[-1]
+        baris.append(f"Korelasi terendah adalah {a} dan {b} ({format_desimal(r)}).")
+    return "\n".join(baris)
+
+def interpretasi_regresi(regresi: pd.DataFrame) -> str:
+    if regresi.empty:
+        return "Regresi membutuhkan data minimal dua tahun."
+
+    baris = [
+        "Interpretasi berikut merangkum hasil regresi linear sederhana untuk masing-masing jenjang pendidikan.",
+    ]
+    for i, (p, row) in enumerate(regresi.iterrows(), start=1):
+        slope, intercept, r2 = row['slope'], row['intercept'], row['r2']
+        tren = "Naik" if slope > 0 else "Turun"
+        arah = "meningkat" if slope > 0 else "menurun"
+        baris += [
+            "",
+            "---",
+            "",
+            f"**{i}. {p}**",
+            "",
+            f"Persamaan regresi: {format_persamaan(slope, intercept)}. Setiap kenaikan satu tahun, "
+            f"**jumlah pengangguran terbuka** {p} cenderung {arah} sebesar {format_angka(abs(slope))} orang.",
+            "",
+        ]
+        if pd.notna(r2):
+            baris.append(
+                f"R-kuadrat (R²): {format_desimal(r2)}. Sekitar {r2 * 100:.0f}% variasi dapat dijelaskan oleh model ini; "
+                f"hubungan {kekuatan_korelasi(r2 ** 0.5)}."
+            )
+        baris += ["", f"Tren: {tren}."]
+    return "\n".join(baris)
+
+def interpretasi_grouped(pivot: pd.DataFrame) -> str:
+    total = pivot.sum(axis=1)
+    tahun_puncak = total.idxmax()
+    tahun_awal, tahun_akhir = pivot.index.min(), pivot.index.max()
+
+    baris = [
+        "**1. Deskripsi Umum Grafik**",
+        "",
+        f"Grafik menyajikan jumlah pengangguran terbuka dari {tahun_awal} hingga {tahun_akhir}; setiap tahun berisi "
+        f"kelompok batang untuk: {', '.join(pivot.columns)}.",
+        "",
+        "**2. Pola dan Tren Tiap Jenjang Pendidikan**",
+        "",
+    ]
+    for p in pivot.mean().sort_values(ascending=False).index:
+        baris.append(
+            f"- {p}: puncak {format_angka(pivot[p].max())} pada {pivot[p].idxmax()}, "
+            f"{format_angka(pivot.loc[tahun_awal, p])} di {tahun_awal} dan {format_angka(pivot.loc[tahun_akhir, p])} di {tahun_akhir}."
+        )
+    baris += ["", f"**3. Tahun Spesial: {tahun_puncak}**", ""]
+    baris += [
+        f"- {p}: {format_angka(v)}"
+        for p, v in pivot.loc[tahun_puncak].sort_values(ascending=False).items()
+    ]
+    return "\n".join(baris)
+
+def interpretasi_kesimpulan(
+    tahun_range: tuple[int, int],
+    stats: pd.DataFrame,
+    pivot: pd.DataFrame,
+    corr: pd.DataFrame,
+    regresi: pd.DataFrame,
+) -> str:
+    rata = stats['mean'].sort_values(ascending=False)
+    teratas = rata.index[0]
+    tahun_puncak = pivot.sum(axis=1).idxmax()
+    pasangan = pasangan_korelasi(corr)
+
+    baris = [
+        f"**Analisis ini membahas kondisi pengangguran terbuka di Jawa Barat dari tahun {tahun_range[0]} sampai "
+        f"{tahun_range[1]}, dilihat dari tingkat pendidikan terakhir para pencari kerja.**",
+        "",
+        f"Lulusan **{teratas}** merupakan kelompok dengan pengangguran terbanyak (rata-rata {format_angka(rata.iloc[0])}), "
+        f"sedangkan {rata.index[-1]} memiliki rata-rata terendah ({format_angka(rata.iloc[-1])}).",
+        "",
+        f"Tahun **{tahun_puncak}** adalah puncak total pengangguran pada rentang tahun yang dipilih.",
+    ]
+    if not pasangan.empty:
+        (a, b), r = next(iter(pasangan.items()))
+        baris += [
+            "",
+            f"Analisis korelasi menunjukkan hubungan terkuat antara {a} dan {b} ({format_desimal(r)}), "
+            "sehingga kondisi ekonomi tertentu dapat mempengaruhi kedua jenjang tersebut bersamaan.",
+        ]
+    if not regresi.empty:
+        naik = [p for p in regresi.index if regresi.loc[p, 'slope'] > 0]
+        turun = [p for p in regresi.index if regresi.loc[p, 'slope'] <= 0]
+        baris += ["", "Prediksi regresi linear menunjukkan:"]
+        if naik:
+            baris.append(f"1. Pengangguran {', '.join(naik)} diperkirakan naik.")
+        if turun:
+            baris.append(f"{2 if naik else 1}. Pengangguran {', '.join(turun)} diperkirakan turun.")
+    baris += [
+        "",
+        f"Oleh karena itu, perlu perhatian khusus pada lulusan {teratas}, misalnya melalui penyesuaian kurikulum dengan "
+        "kebutuhan dunia kerja, kerjasama institusi pendidikan dengan industri, serta program pelatihan kerja.",
+    ]
+    return "\n".join(baris)
+
+# Susun seluruh teks interpretasi; di-cache per versi dataset dan kondisi filter sehingga rerun cukup lookup cache.
+# Argumen berawalan underscore tidak di-hash: nilainya ditentukan oleh file data (path + versi) dan filter,
+# jadi jika file data berubah, versi ikut berubah dan teks dihitung ulang.
+@st.cache_data(max_entries=CACHE_MAKS_ENTRI)
+def buat_interpretasi(
+    path: str,
+    versi: float,
+    tahun_range: tuple[int, int],
+    pendidikan: tuple[str, ...],
+    _stats: pd.DataFrame,
+    _pivot: pd.DataFrame,
+    _corr: pd.DataFrame,
+    _regresi: pd.DataFrame,
+) -> dict[str, str]:
+    """
+    Build the interpretation markdown for every section from the computed results.
+    Returns a dict keyed by section name.
+    """
+    return {
+        'statistik': interpretasi_statistik(_stats),
+        'tren': interpretasi_tren(_pivot),
+        'stacked': interpretasi_stacked(_pivot),
+        'korelasi': interpretasi_korelasi(_corr),
+        'regresi': interpretasi_regresi(_regresi),
+        'grouped': interpretasi_grouped(_pivot),
+        'kesimpulan': interpretasi_kesimpulan(tahun_range, _stats, _pivot, _corr, _regresi),
+    }
 
-    SMP: naik menjadi ±1 juta
+if pivot.empty or len(available_cols) == 0:
+    interpretasi = None
+else:
+    interpretasi = buat_interpretasi(
+        DATA_PATH, versi_dataset, tuple(tahun_range), tuple(available_cols), stats, pivot, corr, regresi
+    )
 
-kemungkinan besar karena dampak pandemi COVID-19 yang menyebabkan PHK massal dan kesulitan pasar kerja.           
+# Judul tiap bagian interpretasi (anchor-nya dipakai oleh link di atas)
+judul_interpretasi = {
+    'statistik': "Interpretasi Hasil Visualisasi Statistik Deskriptif",
+    'tren': "Interpretasi Hasil Visualisasi Tren",
+    'stacked': "Interpretasi Hasil Visualisasi Stacked Bar",
+    'korelasi': "Interpretasi Hasil Visualisasi Heatmap Korelasi",
+    'regresi': "Interpretasi Hasil Visualisasi Regresi Linear Sederhana",
+    'grouped': "Interpretasi Hasil Visualisasi Grouped Bar Chart",
+}
+
+for kunci, judul in judul_interpretasi.items():
+    st.markdown(f"---\n## ✍ {judul}")
+    if interpretasi is None:
+        st.info("Tidak ada data untuk interpretasi pada filter ini.")
+    else:
+        st.markdown(interpretasi[kunci])
+st.markdown("---")
+catat_waktu("interpretasi")
 
----
-""")
 # =========================
 # 12. KESIMPULAN
 # =========================
 
 st.subheader("KESIMPULAN")
 
-if df_filtered.empty:
+if interpretasi is None:
     st.info("Tidak ada data untuk insight otomatis pada filter ini.")
 else:
+    st.markdown(interpretasi['kesimpulan'])
+catat_waktu("kesimpulan")
 
-    # Dapatkan pendidikan dengan rata-rata pengangguran tertinggi pada filter saat ini
-    avg_pengangguran = df_filtered.groupby('pendidikan_bersih')['jumlah_pengangguran_terbuka'].mean()
-    pendidikan_tertinggi = avg_pengangguran.idxmax() # Pendidikan dengan rata-rata pengangguran tertinggi
-    rata_rata_tertinggi = avg_pengangguran.max() # Nilai rata-rata tertinggi
-    
-    # Cari tahun dengan pengangguran terbuka tertinggi pada data hasil filter
-    tahun_tertinggi = df_filtered.loc[df_filtered['jumlah_pengangguran_terbuka'].idxmax()]['tahun']
-
-    st.markdown(f"""
-**Analisis ini membahas kondisi pengangguran terbuka di Jawa Barat dari tahun {tahun_range[0]} sampai {tahun_range[1]}, dilihat dari tingkat pendidikan terakhir para pencari kerja. Tujuannya untuk memahami siapa yang paling banyak menganggur dan bagaimana tren pengangguran berubah berdasarkan jenjang pendidikan.**
-
-Salah satu hasil utama adalah lulusan **SMA/Sederajat** merupakan kelompok dengan pengangguran terbanyak, dengan rata-rata tertinggi dibanding jenjang lain. Kategori ini mencakup lulusan SMA umum dan juga **SMK**. Tingginya angka pengangguran di kelompok ini mungkin karena mereka berada di posisi "tanggung"—seringkali tidak memiliki keahlian teknis yang sangat spesifik seperti jenjang pendidikan tinggi, namun juga memiliki ekspektasi yang berbeda dari pekerjaan di sektor informal.
-
-Lulusan perguruan tinggi (Diploma/Sarjana) memiliki jumlah pengangguran lebih sedikit dan cenderung stabil, menandakan semakin tinggi pendidikan, peluang mendapatkan pekerjaan yang sesuai cenderung lebih besar meskipun tidak 100% terjamin.
-
-Tahun **{tahun_tertinggi}** adalah puncak pengangguran di semua jenjang pada rentang tahun yang dipilih, akibat dampak pandemi COVID-19 yang menyebabkan banyaknya PHK dan pembatasan aktivitas ekonomi. Setelah 2020, jumlah pengangguran menurun pada umumnya, tetapi lulusan SMA/Sederajat tetap mendominasi angka pengangguran.
-
-Dari data proporsi pengangguran, lulusan SMA/Sederajat selalu mendominasi persentase total pengangguran, sementara proporsi pengangguran dari lulusan SD ke bawah dan perguruan tinggi cenderung lebih kecil. Lulusan SD ke bawah seringkali banyak terserap di sektor informal yang tidak selalu tercatat sebagai pengangguran resmi.
-
-Analisis korelasi menunjukkan bahwa saat pengangguran lulusan SMA/Sederajat naik, pengangguran lulusan perguruan tinggi juga cenderung naik. Ini mengindikasikan bahwa dampak kondisi ekonomi tertentu dapat meluas dan mempengaruhi semua jenjang pendidikan, terutama menengah dan tinggi.
-
-Prediksi regresi linear menunjukkan:
-1. Pengangguran lulusan SMA/Sederajat dan SD ke bawah diperkirakan terus naik.
-2. Lulusan SMP diperkirakan mengalami penurunan pengangguran, meskipun prediksinya lemah.
-3. Lulusan pendidikan tinggi diprediksi mengalami kenaikan kecil dan stabil.
-
-Kesimpulannya, pengangguran paling banyak terjadi pada lulusan **pendidikan menengah atas (SMA/Sederajat)**. Lulusan perguruan tinggi memiliki tingkat pengangguran yang lebih rendah dan tren lebih stabil. Sementara itu, lulusan pendidikan rendah kemungkinan besar banyak bekerja di sektor informal dan tidak tercatat secara resmi.
-
-Oleh karena itu, perlu perbaikan kurikulum di jenjang pendidikan menengah atas (baik SMA maupun SMK) agar lebih sesuai dengan kebutuhan dunia kerja. Penting juga untuk mendorong kerjasama yang lebih erat antara institusi pendidikan dan industri, serta memberikan insentif agar lulusan SMA/Sederajat melanjutkan pendidikan atau mengikuti program pelatihan kerja untuk memperoleh keterampilan yang dibutuhkan pasar.
+# =========================
+# 13. PEMANTAUAN MEMORI
+# =========================
 
-**Pada filter saat ini:**
-- **Rata-rata pengangguran terbuka tertinggi berasal dari pendidikan:** `{pendidikan_tertinggi}` (rata-rata: {rata_rata_tertinggi:,.0f})
-- **Tahun dengan pengangguran terbuka tertinggi:** `{tahun_tertinggi}`
-""")
+# Hitung RSS (memori fisik) proses worker saat ini dalam MB
+def memori_proses_mb() -> float:
+    try:
+        # Linux: kolom kedua /proc/self/statm adalah jumlah halaman resident
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024**2
+    except (OSError, ValueError, AttributeError):
+        return 0.0
+
+# Status pengosongan memori, dibagi ke semua sesi di worker ini
+@st.cache_resource
+def status_memori() -> dict[str, Any]:
+    return {'lock': threading.Lock(), 'terakhir': None, 'jumlah': 0, 'rss_sesudah': None}
+
+# Kosongkan cache per-filter, jalankan GC, lalu minta glibc mengembalikan heap bebas ke OS.
+# Tanpa malloc_trim, memori yang sudah dibebaskan CPython/pandas jarang mengurangi RSS.
+def kosongkan_memori() -> None:
+    st.cache_data.clear()
+    gc.collect()
+    try:
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+memori_mb = memori_proses_mb()
+
+# Jika worker melewati batas lunak, kosongkan memori paling sering sekali per MEMORI_JEDA_DETIK,
+# supaya cache tidak terus-menerus dikosongkan saat RSS tetap tinggi (data utama tetap dibagi antar sesi)
+status = status_memori()
+with status['lock']:
+    jeda_lewat = status['terakhir'] is None or monotonic() - status['terakhir'] >= MEMORI_JEDA_DETIK
+    if memori_mb > MEMORI_MAKS_MB and jeda_lewat:
+        kosongkan_memori()
+        memori_mb = memori_proses_mb()
+        status.update(terakhir=monotonic(), jumlah=status['jumlah'] + 1, rss_sesudah=memori_mb)
+
+# Catatan alokasi semua sesi di worker ini (per id sesi), dibagi antar sesi
+@st.cache_resource
+def alokasi_worker() -> dict[str, Any]:
+    return {'lock': threading.Lock(), 'sesi': {}}
+
+if 'id_sesi' not in st.session_state:
+    st.session_state['id_sesi'] = uuid.uuid4().hex[:8]
+
+# Catat alokasi sesi ini dan buang catatan sesi yang sudah lama tidak aktif
+alokasi = alokasi_worker()
+with alokasi['lock']:
+    sekarang = monotonic()
+    alokasi['sesi'][st.session_state['id_sesi']] = {
+        'df_filtered': int(df_filtered.memory_usage(deep=True).sum()),
+        'png_tren': len(png_tren) if png_tren is not None else 0,
+        'csv': len(csv),
+        'terakhir': sekarang,
+    }
+    for id_sesi in [k for k, v in alokasi['sesi'].items() if sekarang - v['terakhir'] > SESI_KEDALUWARSA_DETIK]:
+        del alokasi['sesi'][id_sesi]
+    tabel_alokasi = pd.DataFrame.from_dict(alokasi['sesi'], orient='index')
+
+# Simpan durasi (detik) tiap bagian pada rerun ini
+st.session_state['waktu_bagian'] = {
+    nama: t - t_sebelum for (_, t_sebelum), (nama, t) in zip(titik_waktu, titik_waktu[1:])
+}
+
+# Tampilan admin, hanya muncul jika ADMIN_TOKEN diset dan query parameter ?admin=<token> cocok
+# (dibandingkan sebagai bytes, karena compare_digest menolak str non-ASCII)
+if ADMIN_TOKEN and hmac.compare_digest(st.query_params.get("admin", "").encode(), ADMIN_TOKEN.encode()):
+    with st.sidebar.expander("Admin: Pemantauan Memori", expanded=True):
+        st.metric("RSS worker (MB)", f"{memori_mb:,.0f}", f"batas lunak {MEMORI_MAKS_MB:,} MB", delta_color="off")
+        st.progress(min(memori_mb / MEMORI_MAKS_MB, 1.0))
+        st.metric("Pengosongan memori", status['jumlah'])
+        if status['rss_sesudah'] is not None:
+            st.caption(f"RSS setelah pengosongan terakhir: {status['rss_sesudah']:,.0f} MB")
+        st.metric("Data bersama (MB)", f"{df.memory_usage(deep=True).sum() / 1024**2:,.2f}")
+        st.metric("Render grafik belum selesai", status_render()['belum_selesai'])
+        # Alokasi per sesi (KB) di worker ini, beserta totalnya
+        ukuran_kb = tabel_alokasi.drop(columns='terakhir') / 1024
+        st.metric("Sesi aktif", len(ukuran_kb))
+        st.metric("Total alokasi sesi (KB)", f"{ukuran_kb.to_numpy().sum():,.1f}")
+        st.dataframe(ukuran_kb.round(1))
+        st.write({k: f"{v * 1000:,.1f} ms" for k, v in st.session_state['waktu_bagian'].items()})
@@ -0,0 +1,192 @@
+"""
+Load test lokal untuk app.py: mensimulasikan banyak pengguna dashboard yang
+mengubah slider tahun dan multiselect pendidikan secara bersamaan.
+
+Setiap worker adalah satu proses (seperti satu worker Streamlit) yang menjalankan
+beberapa sesi AppTest di thread terpisah. Tidak membutuhkan jaringan maupun server.
+
+Contoh:
+    python loadtest.py --workers 2 --sesi 10 --langkah 20
+    python loadtest.py --sintetis --tahun 1990 2030
+"""
+
+import argparse
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+# Label pendidikan mentah seperti di data asli, supaya mapping di app.py ikut teruji
+LABEL_PENDIDIKAN = [
+    'TIDAK/BELUM PERNAH SEKOLAH',
+    'TIDAK/BELUM TAMAT SD',
+    'SD',
+    'SMP',
+    'SMA (UMUM)',
+    'SMA (KEJURUAN)',
+    'DIPLOMA I/II/III/AKADEMI/UNIVERSITAS',
+]
+
+
+# Buat data sintetis dengan kolom yang sama seperti cobadata.xlsx
+def buat_data_sintetis(path: str, tahun_awal: int, tahun_akhir: int, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    tahun = np.repeat(np.arange(tahun_awal, tahun_akhir + 1), len(LABEL_PENDIDIKAN))
+    df = pd.DataFrame({
+        'id': np.arange(1, len(tahun) + 1),
+        'kode_provinsi': 32,
+        'nama_provinsi': 'JAWA BARAT',
+        'pendidikan': LABEL_PENDIDIKAN * (tahun_akhir - tahun_awal + 1),
+        'jumlah_pengangguran_terbuka': rng.integers(50_000, 1_000_000, len(tahun)),
+        'satuan': 'ORANG',
+        'tahun': tahun,
+    })
+    df.to_excel(path, index=False)
+
+
+# Memori fisik (RSS) proses saat ini dalam MB
+def memori_proses_mb() -> float:
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024**2
+    except (OSError, ValueError, AttributeError):
+        return 0.0
+
+
+# Satu sesi pengguna: buka halaman lalu ubah filter secara acak beberapa kali
+def jalankan_sesi(langkah: int, seed: int, timeout: float) -> dict:
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed)
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    hasil = {'rerun': [], 'bagian': [], 'error': 0}
+
+    # Jalankan satu aksi, catat latensinya; return False jika gagal (dihitung sebagai error)
+    def rerun(aksi) -> bool:
+        mulai = perf_counter()
+        try:
+            aksi()
+        except Exception:
+            # Misalnya timeout rerun
+            hasil['error'] += 1
+            return False
+        hasil['rerun'].append(perf_counter() - mulai)
+        if at.exception:
+            hasil['error'] += 1
+            return False
+        hasil['bagian'].append(dict(at.session_state['waktu_bagian']))
+        return True
+
+    # Tanpa run pertama yang berhasil, widget filter tidak ada; sesi ini berhenti di sini
+    if not rerun(at.run):
+        return hasil
+    if not at.sidebar.slider or not at.sidebar.multiselect:
+        hasil['error'] += 1
+        return hasil
+    slider = at.sidebar.slider[0]
+    multiselect = at.sidebar.multiselect[0]
+    tahun_min, tahun_max = int(slider.min), int(slider.max)
+    pilihan = list(multiselect.options)
+
+    for _ in range(langkah):
+        if rng.random() < 0.5:
+            a, b = sorted(rng.sample(range(tahun_min, tahun_max + 1), 2))
+            rerun(lambda: at.sidebar.slider[0].set_value((a, b)).run())
+        else:
+            terpilih = rng.sample(pilihan, rng.randint(1, len(pilihan)))
+            rerun(lambda: at.sidebar.multiselect[0].set_value(terpilih).run())
+    return hasil
+
+
+# Satu worker: beberapa sesi bersamaan dalam satu proses
+def jalankan_worker(sesi: int, langkah: int, seed: int, timeout: float, data_path: str) -> dict:
+    os.environ['DATA_PATH'] = data_path
+    os.chdir(os.path.dirname(APP_PATH))
+
+    # Pemanasan satu run, supaya import streamlit/app dan load data tidak terhitung sebagai pertumbuhan memori.
+    # Jika gagal (misalnya timeout), dicatat sebagai error worker; sesi tetap dijalankan.
+    from streamlit.testing.v1 import AppTest
+    error_pemanasan = 0
+    try:
+        if AppTest.from_file(APP_PATH, default_timeout=timeout).run().exception:
+            error_pemanasan = 1
+    except Exception:
+        error_pemanasan = 1
+    memori_awal = memori_proses_mb()
+    with ThreadPoolExecutor(max_workers=sesi) as pool:
+        semua = list(pool.map(
+            lambda i: jalankan_sesi(langkah, seed + i, timeout), range(sesi)
+        ))
+    return {
+        'rerun': [t for h in semua for t in h['rerun']],
+        'bagian': [b for h in semua for b in h['bagian']],
+        'error': error_pemanasan + sum(h['error'] for h in semua),
+        'memori_awal': memori_awal,
+        'memori_akhir': memori_proses_mb(),
+    }
+
+
+def persentil_ms(nilai: list[float]) -> str:
+    if not nilai:
+        return "tidak ada data (n=0)"
+    p50, p90, p99 = np.percentile(nilai, [50, 90, 99]) * 1000
+    return f"p50 {p50:8.1f}  p90 {p90:8.1f}  p99 {p99:8.1f}  (n={len(nilai)})"
+
+
+def cetak_laporan(hasil_worker: list[dict], durasi: float) -> None:
+    rerun = [t for h in hasil_worker for t in h['rerun']]
+    bagian = pd.DataFrame([b for h in hasil_worker for b in h['bagian']])
+
+    print("\n=== Latensi per bagian (ms) ===")
+    for nama in bagian.columns:
+        print(f"{nama:<14}{persentil_ms(bagian[nama].dropna().tolist())}")
+    print(f"{'TOTAL RERUN':<14}{persentil_ms(rerun)}")
+
+    print("\n=== Throughput ===")
+    print(f"{len(rerun)} rerun dalam {durasi:.1f} s → {len(rerun) / durasi:.1f} rerun/s")
+    print(f"Error: {sum(h['error'] for h in hasil_worker)}")
+
+    print("\n=== Memori per worker (MB) ===")
+    for i, h in enumerate(hasil_worker):
+        print(f"worker {i}: awal {h['memori_awal']:.0f} → akhir {h['memori_akhir']:.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test app.py dengan sesi AppTest bersamaan.")
+    parser.add_argument('--workers', type=int, default=1, help="Jumlah proses worker")
+    parser.add_argument('--sesi', type=int, default=4, help="Jumlah sesi bersamaan per worker")
+    parser.add_argument('--langkah', type=int, default=10, help="Jumlah perubahan filter per sesi")
+    parser.add_argument('--sintetis', action='store_true', help="Pakai data sintetis, bukan cobadata.xlsx")
+    parser.add_argument('--tahun', type=int, nargs=2, default=(2011, 2023), metavar=('AWAL', 'AKHIR'),
+                        help="Rentang tahun data sintetis")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=60, help="Batas waktu satu rerun (detik)")
+    args = parser.parse_args()
+    if args.sintetis and args.tahun[0] >= args.tahun[1]:
+        parser.error("--tahun: AWAL harus lebih kecil dari AKHIR (slider tahun butuh rentang)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = os.path.join(os.path.dirname(APP_PATH), 'cobadata.xlsx')
+        if args.sintetis:
+            data_path = os.path.join(tmp, 'sintetis.xlsx')
+            buat_data_sintetis(data_path, args.tahun[0], args.tahun[1], args.seed)
+
+        mulai = perf_counter()
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = [
+                pool.submit(jalankan_worker, args.sesi, args.langkah,
+                            args.seed + i * args.sesi, args.timeout, data_path)
+                for i in range(args.workers)
+            ]
+            hasil_worker = [f.result() for f in futures]
+        cetak_laporan(hasil_worker, perf_counter() - mulai)
+
+
+if __name__ == '__main__':
+    main()